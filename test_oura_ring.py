@@ -0,0 +1,1493 @@
+import asyncio
+import io
+import json
+import os
+import pickle
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+import urllib3
+
+import oura_ring
+from oura_ring import AsyncOuraClient, OuraClient
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+needs_httpx = pytest.mark.skipif(httpx is None, reason="needs httpx")
+needs_ijson = pytest.mark.skipif(oura_ring.ijson is None, reason="needs ijson")
+needs_numpy = pytest.mark.skipif(oura_ring.np is None, reason="needs numpy")
+
+
+def _response(status_code=200, body=b"{}", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+
+    return response
+
+
+@pytest.fixture
+def client(request):
+    # A token per test keeps the shared session registry from leaking between tests.
+    with OuraClient(f"token-{request.node.name}") as client:
+        yield client
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(oura_ring.time, "sleep", sleeps.append)
+
+    return sleeps
+
+
+def test_cache_key_ignores_param_order():
+    assert oura_ring._cache_key("GET", "slug", {"a": 1, "b": 2}) == (
+        oura_ring._cache_key("GET", "slug", {"b": 2, "a": 1})
+    )
+
+
+def test_cache_key_distinguishes_requests():
+    keys = {
+        oura_ring._cache_key("GET", "slug", {}),
+        oura_ring._cache_key("GET", "other", {}),
+        oura_ring._cache_key("POST", "slug", {}),
+        oura_ring._cache_key("GET", "slug", {"a": 1}),
+    }
+
+    assert len(keys) == 4
+
+
+def test_cache_expiry_never_expires_past_windows():
+    end = (date.today() - timedelta(days=2)).isoformat()
+
+    assert oura_ring._cache_expiry({"end_date": end}) is None
+    assert oura_ring._cache_expiry({"end_datetime": f"{end} 23:59:59"}) is None
+
+
+@pytest.mark.parametrize("days_ago", [0, 1])
+def test_cache_expiry_refreshes_recent_windows(days_ago):
+    end = (date.today() - timedelta(days=days_ago)).isoformat()
+    expires = oura_ring._cache_expiry({"end_date": end})
+
+    assert expires == pytest.approx(time.time() + oura_ring.CACHE_TTL, abs=5)
+
+
+def test_cache_expiry_refreshes_undated_requests():
+    expires = oura_ring._cache_expiry({})
+
+    assert expires == pytest.approx(time.time() + oura_ring.CACHE_TTL, abs=5)
+
+
+def test_response_cache_drops_expired_entries():
+    cache = oura_ring._ResponseCache(8)
+    cache.set("fresh", {"a": 1}, None)
+    cache.set("stale", {"a": 1}, time.time() - 1)
+
+    assert cache.get("fresh") == {"a": 1}
+    assert cache.get("stale") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = oura_ring._ResponseCache(2)
+    cache.set("a", 1, None)
+    cache.set("b", 2, None)
+    cache.get("a")
+    cache.set("c", 3, None)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cached_records_are_isolated_from_callers(client, monkeypatch):
+    body = b'{"data": [{"id": "1", "day": "2020-01-01"}], "next_token": null}'
+    monkeypatch.setattr(client.session, "send", lambda *_, **__: _response(body=body))
+
+    records = client.get_daily_sleep("2020-01-01", "2020-01-01")
+    records[0]["day"] = "MUTATED"
+    records.append({})
+
+    assert client.get_daily_sleep("2020-01-01", "2020-01-01") == [
+        {"id": "1", "day": "2020-01-01"}
+    ]
+
+
+def test_revalidated_responses_are_isolated_from_callers(client, monkeypatch):
+    monkeypatch.setattr(oura_ring, "CACHE_TTL", -1)
+    responses = iter(
+        [
+            _response(body=b'{"id": "x"}', headers={"ETag": '"abc"'}),
+            _response(status_code=304),
+        ]
+    )
+    sent = []
+
+    def send(prepared, **_):
+        sent.append(prepared.headers.get("If-None-Match"))
+        return next(responses)
+
+    monkeypatch.setattr(client.session, "send", send)
+
+    client.get_personal_info()["id"] = "MUTATED"
+
+    assert client.get_personal_info() == {"id": "x"}
+    assert sent == [None, '"abc"']
+
+
+def test_changed_responses_are_decoded_once(client, monkeypatch):
+    monkeypatch.setattr(oura_ring, "CACHE_TTL", -1)
+    decoded = []
+
+    def loads(raw):
+        decoded.append(raw)
+        return json.loads(raw)
+
+    monkeypatch.setattr(oura_ring, "_json_loads", loads)
+    monkeypatch.setattr(
+        client.session,
+        "send",
+        lambda *_, **__: _response(
+            body=b'{"id": "x"}', headers={"Last-Modified": "Wed, 01 Jan 2020"}
+        ),
+    )
+
+    client.get_personal_info()
+    client.get_personal_info()
+
+    assert decoded == [b'{"id": "x"}', b'{"id": "x"}']
+
+
+def test_cache_dir_is_separate_per_token(tmp_path, monkeypatch):
+    def send_for(name):
+        return lambda *_, **__: _response(body=b'{"name": "%b"}' % name.encode())
+
+    with OuraClient("token-a", cache_dir=str(tmp_path)) as first:
+        monkeypatch.setattr(first.session, "send", send_for("a"))
+        first.get_personal_info()
+
+    with OuraClient("token-b", cache_dir=str(tmp_path)) as second:
+        monkeypatch.setattr(second.session, "send", send_for("b"))
+
+        assert second.get_personal_info() == {"name": "b"}
+
+        second.cache_clear()
+
+    with OuraClient("token-a", cache_dir=str(tmp_path)) as first:
+        monkeypatch.setattr(first.session, "send", send_for("changed"))
+
+        assert first.get_personal_info() == {"name": "a"}
+
+
+def test_live_heart_rate_windows_are_not_cached(tmp_path, monkeypatch):
+    body = b'{"data": [{"bpm": 60}], "next_token": null}'
+
+    with OuraClient("token-live", cache_dir=str(tmp_path)) as client:
+        monkeypatch.setattr(
+            client.session, "send", lambda *_, **__: _response(body=body)
+        )
+
+        for _ in range(3):
+            assert client.get_heart_rate() == [{"bpm": 60}]
+
+        assert not client._cache._entries
+        assert not list(tmp_path.rglob("*.json"))
+
+        client.get_heart_rate("2020-01-01T00:00:00", "2020-01-02T00:00:00")
+
+        assert len(client._cache._entries) == 1
+        assert len(list(tmp_path.rglob("*.json"))) == 1
+
+
+def test_cache_dir_drops_expired_files_on_write(tmp_path):
+    cache = oura_ring._ResponseCache(8, str(tmp_path))
+    cache.set("a" * 64, 1, time.time() - 1)
+    cache.set("b" * 64, 2, None)
+    (tmp_path / "notes.json").write_text("{}")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"{'b' * 64}.json",
+        "notes.json",
+    ]
+
+
+def test_cache_dir_is_bounded_by_maxsize(tmp_path):
+    cache = oura_ring._ResponseCache(2, str(tmp_path))
+
+    for age, key in enumerate(["a", "b"]):
+        cache.set(key * 64, 1, None)
+        os.utime(tmp_path / f"{key * 64}.json", (age, age))
+
+    cache.set("c" * 64, 1, time.time() + 60)
+
+    assert sorted(path.name[0] for path in tmp_path.iterdir()) == ["b", "c"]
+
+
+@pytest.fixture
+def server():
+    statuses = []
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *_):
+            pass
+
+        def do_GET(self):
+            requests_seen.append(self.path)
+            status = statuses.pop(0) if statuses else 200
+
+            if status is None:
+                time.sleep(1)
+                return
+
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", statuses, requests_seen
+
+    httpd.shutdown()
+
+
+def _mount_http(client):
+    client.session.mount("http://", client.session.get_adapter("https://"))
+
+
+def test_read_timeouts_are_not_retried(client, server, monkeypatch):
+    url, statuses, seen = server
+    statuses.append(None)
+    monkeypatch.setattr(oura_ring, "API_URL", url)
+    monkeypatch.setattr(oura_ring, "TIMEOUT", (1, 0.2))
+    _mount_http(client)
+
+    with pytest.raises(requests.ReadTimeout):
+        client.get_personal_info()
+
+    assert len(seen) == 1
+
+
+def test_server_errors_are_retried(client, server, monkeypatch, no_sleep):
+    url, statuses, seen = server
+    statuses.extend([503, 502])
+    monkeypatch.setattr(oura_ring, "API_URL", url)
+    _mount_http(client)
+
+    assert client.get_personal_info() == {}
+    assert len(seen) == 3
+
+
+def test_clients_with_same_token_share_a_session():
+    with OuraClient("shared") as first, OuraClient("shared") as second:
+        assert first.session is second.session
+
+        with OuraClient("other") as other:
+            assert other.session is not first.session
+
+
+def test_session_closes_with_last_client(monkeypatch):
+    first = OuraClient("closing")
+    second = OuraClient("closing")
+    closed = []
+    monkeypatch.setattr(first.session, "close", lambda: closed.append(True))
+
+    first.close()
+    assert not closed
+
+    del second
+    assert closed == [True]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_clients_reacquire_session_after_fork(client):
+    parent_session = client.session
+    read, write = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover - runs in the child
+        ok = client.session is not parent_session
+        os.write(write, b"1" if ok else b"0")
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b"1"
+    assert client.session is parent_session
+
+
+def test_full_url_follows_api_url(monkeypatch):
+    assert oura_ring._full_url("v2/x") == f"{oura_ring.API_URL}/v2/x"
+
+    monkeypatch.setattr(oura_ring, "API_URL", "http://localhost:1")
+
+    assert oura_ring._full_url("v2/x") == "http://localhost:1/v2/x"
+
+
+def test_format_dates_returns_iso_strings():
+    assert oura_ring._format_dates("2020-01-01", date(2020, 1, 2)) == (
+        "2020-01-01",
+        "2020-01-02",
+    )
+
+
+def test_format_dates_defaults_to_yesterday_and_today():
+    today = date.today()
+
+    assert oura_ring._format_dates(None, None) == (
+        str(today - timedelta(days=1)),
+        str(today),
+    )
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [("2024-02-30", "2024-03-01"), ("2024-01-05", "2024-01-01"), ("soon", None)],
+)
+def test_format_dates_rejects_invalid_ranges(start, end):
+    with pytest.raises(ValueError):
+        oura_ring._format_dates(start, end)
+
+
+def test_iter_rejects_impossible_dates_before_sending(client, monkeypatch):
+    monkeypatch.setattr(client.session, "send", pytest.fail)
+
+    with pytest.raises(ValueError):
+        client.iter_daily_sleep("2024-02-30", "2024-03-01")
+
+
+def test_format_datetimes_normalises_separator():
+    assert oura_ring._format_datetimes(
+        "2020-01-01T00:00:00", "2020-01-02 12:30:00"
+    ) == ("2020-01-01 00:00:00", "2020-01-02 12:30:00")
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [
+        ("2024-02-30T00:00:00", "2024-03-01T00:00:00"),
+        ("2024-01-02T00:00:00", "2024-01-01T00:00:00"),
+    ],
+)
+def test_format_datetimes_rejects_invalid_ranges(start, end):
+    with pytest.raises(ValueError):
+        oura_ring._format_datetimes(start, end)
+
+
+def test_split_date_range_keeps_short_ranges():
+    params = {"start_date": "2020-01-01", "end_date": "2020-01-13"}
+
+    assert oura_ring._split_date_range(params) == [params]
+
+
+def test_split_date_range_keeps_undated_requests():
+    assert oura_ring._split_date_range({"next_token": "x"}) == [{"next_token": "x"}]
+
+
+def test_split_date_range_covers_each_day_once():
+    windows = oura_ring._split_date_range(
+        {"start_date": "2020-01-01", "end_date": "2020-03-01"}
+    )
+    days = [
+        date.fromisoformat(window["start_date"]) + timedelta(days=offset)
+        for window in windows
+        for offset in range(
+            (
+                date.fromisoformat(window["end_date"])
+                - date.fromisoformat(window["start_date"])
+            ).days
+            + 1
+        )
+    ]
+
+    assert len(windows) > 1
+    assert days[0] == date(2020, 1, 1)
+    assert days[-1] == date(2020, 3, 1)
+    assert len(days) == len(set(days)) == 61
+
+
+def test_split_datetime_range_keeps_short_ranges():
+    params = {
+        "start_datetime": "2020-01-01 00:00:00",
+        "end_datetime": "2020-01-15 00:00:00",
+    }
+
+    assert oura_ring._split_date_range(params) == [params]
+
+
+def test_split_datetime_range_windows_are_contiguous():
+    windows = oura_ring._split_date_range(
+        {
+            "start_datetime": "2020-01-01 00:00:00",
+            "end_datetime": "2020-03-01 12:00:00",
+        }
+    )
+
+    assert len(windows) > 1
+    assert windows[0]["start_datetime"] == "2020-01-01 00:00:00"
+    assert windows[-1]["end_datetime"] == "2020-03-01 12:00:00"
+
+    for previous, current in zip(windows, windows[1:]):
+        gap = datetime.fromisoformat(current["start_datetime"]) - (
+            datetime.fromisoformat(previous["end_datetime"])
+        )
+
+        assert gap == timedelta(seconds=1)
+
+
+def test_split_windows_drop_duplicate_records():
+    pages = [[{"id": "1"}, {"id": "2"}], [{"id": "2"}, {"id": "3"}, {"bpm": 60}]]
+
+    assert oura_ring._drop_duplicates(pages) == [
+        [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"bpm": 60}]
+    ]
+
+
+@pytest.mark.parametrize(
+    "end",
+    ["2024-01-02", date(2024, 1, 2)],
+)
+def test_bundle_heart_rate_covers_the_whole_end_date(client, monkeypatch, end):
+    calls = {}
+
+    for name in ("daily_sleep", "heart_rate"):
+        monkeypatch.setattr(
+            OuraClient,
+            f"get_{name}",
+            lambda self, start, stop, name=name: calls.setdefault(name, (start, stop)),
+        )
+
+    bundle = client.get_bundle(["daily_sleep", "heart_rate"], "2024-01-01", end)
+
+    assert bundle == calls
+    assert calls["daily_sleep"] == ("2024-01-01", end)
+    assert calls["heart_rate"] == ("2024-01-01", datetime(2024, 1, 2, 23, 59, 59))
+
+
+@pytest.mark.parametrize("end", [None, "2024-01-02T12:00:00", datetime(2024, 1, 2)])
+def test_bundle_keeps_explicit_heart_rate_times(end):
+    assert oura_ring._bundle_window("heart_rate", None, end) == (None, end)
+
+
+def test_date_ranges_make_one_request_and_split_by_day(client, monkeypatch):
+    calls = []
+
+    def get_daily_sleep(self, start_date, end_date):
+        calls.append((start_date, end_date))
+        return [{"day": f"2024-01-0{day}"} for day in range(1, 8)]
+
+    monkeypatch.setattr(OuraClient, "get_daily_sleep", get_daily_sleep)
+    ranges = client.get_date_ranges(
+        "daily_sleep", [("2024-01-01", "2024-01-02"), ("2024-01-05", "2024-01-07")]
+    )
+
+    assert calls == [("2024-01-01", "2024-01-07")]
+    assert [[record["day"][-1] for record in days] for days in ranges] == [
+        ["1", "2"],
+        ["5", "6", "7"],
+    ]
+    assert client.get_date_ranges("daily_sleep", []) == []
+
+
+@pytest.mark.parametrize("endpoint", ["heart_rate", "rest_mode_period", "nope"])
+def test_date_ranges_reject_endpoints_without_day(client, endpoint):
+    with pytest.raises(ValueError, match="no `day` field"):
+        client.get_date_ranges(endpoint, [("2024-01-01", "2024-01-02")])
+
+
+def test_split_windows_run_on_the_client_pool(client, monkeypatch):
+    threads = set()
+
+    def send_request(self, prepared, settings):
+        threads.add(threading.current_thread().name)
+        return {"data": [{"id": prepared.url}], "next_token": None}
+
+    monkeypatch.setattr(OuraClient, "_send_request", send_request)
+    before = threading.active_count()
+    records = client.get_daily_sleep("2024-01-01", "2024-12-31")
+
+    assert len(records) == 27
+    assert all(name.startswith("oura-ring") for name in threads)
+    assert threading.active_count() - before <= oura_ring._MAX_IN_FLIGHT
+
+
+def test_early_exit_cancels_the_prefetched_page(client, monkeypatch):
+    sent = []
+    release = threading.Event()
+
+    def send_request(self, prepared, settings):
+        sent.append(prepared.url)
+        return {"data": [len(sent)], "next_token": "more"}
+
+    monkeypatch.setattr(OuraClient, "_send_request", send_request)
+
+    # Occupy every worker so the prefetch is still queued when the walk stops.
+    for _ in range(oura_ring._MAX_IN_FLIGHT):
+        client._submit(release.wait, 5)
+
+    walk = client._iter_pages("GET", "slug", params={})
+
+    assert next(walk) == [1]
+    walk.close()
+    release.set()
+    client._executor.shutdown(wait=True)
+
+    assert len(sent) == 1
+
+
+def test_close_shuts_down_the_pool():
+    client = OuraClient("pool")
+    client.close()
+
+    with pytest.raises(RuntimeError):
+        client._submit(print)
+
+
+def test_rate_limited_requests_are_retried(client, monkeypatch, no_sleep):
+    responses = iter(
+        [
+            _response(status_code=429, headers={"Retry-After": "2"}),
+            _response(status_code=429),
+            _response(body=b'{"id": "x"}'),
+        ]
+    )
+    monkeypatch.setattr(client.session, "send", lambda *_, **__: next(responses))
+
+    assert client.get_personal_info() == {"id": "x"}
+    assert no_sleep == [2.0, 1.0]
+
+
+def test_rate_limit_retries_run_out(client, monkeypatch, no_sleep):
+    monkeypatch.setattr(
+        client.session, "send", lambda *_, **__: _response(status_code=429)
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.get_personal_info()
+
+    assert len(no_sleep) == oura_ring.RATE_LIMIT_RETRIES
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [({}, 1.0), ({"Retry-After": "3"}, 3.0), ({"Retry-After": "soon"}, 1.0)],
+)
+def test_retry_after(headers, expected):
+    assert oura_ring._retry_after(headers) == expected
+
+
+def _pages(request):
+    # Three pages of one record each, chained through `next_token`.
+    page = int(request.url.params.get("next_token", 0))
+    token = str(page + 1) if page < 2 else None
+
+    return httpx.Response(
+        200,
+        json={"data": [{"id": f"{page}", "day": "2024-01-01"}], "next_token": token},
+    )
+
+
+def _async_client(handler, token="async"):
+    client = AsyncOuraClient(token)
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return client
+
+
+@needs_httpx
+def test_async_client_walks_every_page():
+    async def main():
+        async with _async_client(_pages) as client:
+            return await client.get_daily_sleep("2024-01-01", "2024-01-02")
+
+    assert [record["id"] for record in asyncio.run(main())] == ["0", "1", "2"]
+
+
+@needs_httpx
+def test_async_client_fetches_split_windows_once_each():
+    starts = []
+
+    def handler(request):
+        starts.append(request.url.params["start_date"])
+        return httpx.Response(200, json={"data": [{"id": "same"}], "next_token": None})
+
+    async def main():
+        async with _async_client(handler) as client:
+            return await client.get_daily_activity("2024-01-01", "2024-02-29")
+
+    assert asyncio.run(main()) == [{"id": "same"}]
+    assert len(starts) == len(set(starts)) == 5
+
+
+@needs_httpx
+def test_async_client_caches_documents():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": "me"})
+
+    async def main():
+        async with _async_client(handler) as client:
+            first = await client.get_personal_info()
+            second = await client.get_personal_info()
+            await client.get_tags(document_id="abc")
+
+        return first, second, client.session
+
+    assert asyncio.run(main()) == ({"id": "me"}, {"id": "me"}, None)
+    assert calls == ["/v2/usercollection/personal_info", "/v2/usercollection/tag/abc"]
+
+
+@needs_httpx
+def test_async_client_retries_rate_limits(monkeypatch):
+    statuses = iter([429, 429, 200])
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    def handler(request):
+        status = next(statuses)
+        headers = {"Retry-After": "2"} if status == 429 else {}
+        return httpx.Response(status, json={"id": "me"}, headers=headers)
+
+    monkeypatch.setattr(oura_ring.asyncio, "sleep", sleep)
+
+    async def main():
+        async with _async_client(handler) as client:
+            return await client.get_personal_info()
+
+    assert asyncio.run(main()) == {"id": "me"}
+    assert sleeps == [2.0, 2.0]
+
+
+@needs_httpx
+def test_async_client_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(oura_ring, "CACHE_TTL", -1)
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": "me"}, headers={"ETag": '"v1"'})
+
+    async def main():
+        async with _async_client(handler) as client:
+            return [await client.get_personal_info() for _ in range(2)]
+
+    assert asyncio.run(main()) == [{"id": "me"}, {"id": "me"}]
+    assert seen == [None, '"v1"']
+
+
+@needs_httpx
+def test_async_client_raises_http_errors():
+    async def main():
+        async with _async_client(lambda request: httpx.Response(401)) as client:
+            await client.get_personal_info()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+
+
+def test_async_client_requires_httpx(monkeypatch):
+    monkeypatch.setattr(oura_ring, "httpx", None)
+
+    with pytest.raises(ImportError, match="httpx"):
+        AsyncOuraClient("token")
+
+
+@needs_httpx
+def test_async_session_is_http2_and_reused():
+    client = AsyncOuraClient("secret")
+    session = client._get_session()
+    pool = session._transport._pool
+
+    assert client._get_session() is session
+    assert session.headers["Authorization"] == "Bearer secret"
+    assert pool._http2
+    assert pool._keepalive_expiry == oura_ring.KEEPALIVE_EXPIRY
+
+    asyncio.run(client.close())
+
+    assert client.session is None
+    assert session.is_closed
+
+
+_ITER_ENDPOINTS = [
+    "daily_activity",
+    "daily_readiness",
+    "daily_sleep",
+    "daily_spo2",
+    "daily_stress",
+    "enhanced_tag",
+    "heart_rate",
+    "rest_mode_period",
+    "ring_configuration",
+    "sessions",
+    "sleep_periods",
+    "sleep_time",
+    "tags",
+    "workouts",
+]
+
+
+@pytest.mark.parametrize("name", _ITER_ENDPOINTS)
+def test_iter_yields_records_lazily(client, monkeypatch, name):
+    monkeypatch.setattr(oura_ring, "ijson", None)
+    urls = []
+
+    def send_request(self, prepared, settings):
+        urls.append(prepared.url)
+        page = len(urls)
+        return {"data": [page], "next_token": "more" if page < 3 else None}
+
+    monkeypatch.setattr(OuraClient, "_send_request", send_request)
+    records = getattr(client, f"iter_{name}")()
+
+    assert not urls
+    assert list(records) == [1, 2, 3]
+    assert urls[0].startswith(
+        oura_ring._full_url(getattr(oura_ring, f"_SLUG_{name.upper()}"))
+    )
+
+
+@needs_httpx
+@pytest.mark.parametrize("name", _ITER_ENDPOINTS)
+def test_async_iter_yields_every_record(name):
+    paths = set()
+
+    def handler(request):
+        paths.add(request.url.path)
+        return _pages(request)
+
+    async def main():
+        async with _async_client(handler) as client:
+            return [record["id"] async for record in getattr(client, f"iter_{name}")()]
+
+    assert asyncio.run(main()) == ["0", "1", "2"]
+    assert paths == {"/" + getattr(oura_ring, f"_SLUG_{name.upper()}")}
+
+
+@needs_httpx
+def test_async_iter_cancels_the_next_page_on_early_exit():
+    cancelled = []
+
+    async def handler(request):
+        if "next_token" in request.url.params:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return _pages(request)
+
+    async def main():
+        async with _async_client(handler) as client:
+            records = client.iter_daily_sleep()
+            first = await records.__anext__()
+            await started.wait()
+            await records.aclose()
+
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+            return first["id"], list(cancelled)
+
+    started = asyncio.Event()
+
+    assert asyncio.run(main()) == ("0", [True])
+
+
+def _streamed(status_code=200, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(json.dumps(body or {}).encode()),
+        status=status_code,
+        preload_content=False,
+    )
+
+    return response
+
+
+@needs_ijson
+def test_stream_items_builds_records_and_returns_next_token():
+    page = {
+        "data": [{"id": "a", "score": 1.5, "contributors": {"x": [1, 2]}}, {"id": "b"}],
+        "next_token": "more",
+    }
+    items = oura_ring._stream_items(io.BytesIO(json.dumps(page).encode()))
+    records = []
+
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            records.append(next(items))
+
+    assert records == page["data"]
+    assert isinstance(records[0]["score"], float)
+    assert stop.value.value == "more"
+
+
+@needs_ijson
+def test_iter_streams_every_page(client, monkeypatch):
+    calls = []
+
+    def send(prepared, **settings):
+        calls.append((prepared.url, settings["stream"]))
+        token = len(calls) if len(calls) < 3 else None
+        return _streamed(body={"data": [{"id": len(calls)}], "next_token": token})
+
+    monkeypatch.setattr(client.session, "send", send)
+    records = client.iter_daily_sleep("2024-01-01", "2024-01-02")
+
+    assert [record["id"] for record in records] == [1, 2, 3]
+    assert [stream for _, stream in calls] == [True] * 3
+    assert "next_token=2" in calls[2][0]
+
+
+@needs_ijson
+def test_iter_stream_waits_out_rate_limits(client, monkeypatch, no_sleep):
+    responses = iter(
+        [
+            _streamed(429, headers={"Retry-After": "3"}),
+            _streamed(body={"data": [{"id": "a"}], "next_token": None}),
+        ]
+    )
+    monkeypatch.setattr(client.session, "send", lambda *_, **__: next(responses))
+
+    assert list(client.iter_daily_sleep("2024-01-01", "2024-01-02")) == [{"id": "a"}]
+    assert no_sleep == [3.0]
+
+
+@needs_ijson
+def test_iter_stream_gives_up_after_rate_limit_retries(client, monkeypatch, no_sleep):
+    monkeypatch.setattr(
+        client.session, "send", lambda *_, **__: _streamed(429, headers={})
+    )
+
+    with pytest.raises(requests.HTTPError):
+        list(client.iter_daily_sleep("2024-01-01", "2024-01-02"))
+
+    assert len(no_sleep) == oura_ring.RATE_LIMIT_RETRIES
+
+
+def test_next_page_is_fetched_while_the_current_one_is_consumed(client, monkeypatch):
+    prefetched = threading.Event()
+
+    def send_request(self, prepared, settings):
+        if "next_token" in prepared.url:
+            prefetched.set()
+            return {"data": [2], "next_token": None}
+        return {"data": [1], "next_token": "more"}
+
+    monkeypatch.setattr(OuraClient, "_send_request", send_request)
+    walk = client._iter_pages("GET", "slug", params={})
+
+    assert next(walk) == [1]
+    assert prefetched.wait(5)
+    assert list(walk) == [[2]]
+
+
+def test_stopping_early_does_not_wait_for_the_prefetched_page(client, monkeypatch):
+    monkeypatch.setattr(oura_ring, "ijson", None)
+    release = threading.Event()
+
+    def send_request(self, prepared, settings):
+        if "next_token" in prepared.url:
+            release.wait(5)
+        return {"data": [1, 2], "next_token": "more"}
+
+    monkeypatch.setattr(OuraClient, "_send_request", send_request)
+    records = client.iter_daily_sleep("2024-01-01", "2024-01-02")
+    started = time.monotonic()
+
+    assert next(records) == 1
+    records.close()
+
+    assert time.monotonic() - started < 1
+    release.set()
+
+
+def test_bundle_fetches_endpoints_concurrently(client, monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+
+    for name in ("daily_sleep", "workouts"):
+        monkeypatch.setattr(
+            OuraClient,
+            f"get_{name}",
+            lambda self, start, end, name=name: [name, barrier.wait() >= 0],
+        )
+
+    assert client.get_bundle(["daily_sleep", "workouts"]) == {
+        "daily_sleep": ["daily_sleep", True],
+        "workouts": ["workouts", True],
+    }
+    assert client.get_bundle([]) == {}
+
+
+@needs_httpx
+def test_async_bundle_gathers_endpoints():
+    async def main():
+        async with _async_client(_pages) as client:
+            return await client.get_bundle(
+                ["daily_sleep", "heart_rate"], "2024-01-01", "2024-01-02"
+            )
+
+    bundle = asyncio.run(main())
+
+    assert [len(records) for records in bundle.values()] == [3, 3]
+
+
+def test_bundle_defaults_to_every_daily_endpoint(client, monkeypatch):
+    for name in oura_ring._DAILY_ENDPOINTS:
+        monkeypatch.setattr(
+            OuraClient, f"get_{name}", lambda self, start, end, name=name: [name]
+        )
+
+    bundle = client.get_bundle(start_date="2024-01-01", end_date="2024-01-02")
+
+    assert bundle == {name: [name] for name in oura_ring._DAILY_ENDPOINTS}
+
+
+@needs_httpx
+def test_async_date_ranges_split_one_request():
+    starts = []
+
+    def handler(request):
+        starts.append(request.url.params["start_date"])
+        days = [{"id": str(day), "day": f"2024-01-0{day}"} for day in range(1, 6)]
+        return httpx.Response(200, json={"data": days, "next_token": None})
+
+    async def main():
+        async with _async_client(handler) as client:
+            ranges = [("2024-01-01", "2024-01-01"), ("2024-01-04", "2024-01-05")]
+            return (
+                await client.get_date_ranges("daily_sleep", ranges),
+                await client.get_date_ranges("daily_sleep", []),
+            )
+
+    ranges, empty = asyncio.run(main())
+
+    assert starts == ["2024-01-01"]
+    assert [[record["id"] for record in days] for days in ranges] == [["1"], ["4", "5"]]
+    assert empty == []
+
+
+def test_format_datetimes_defaults_to_the_last_day_in_utc():
+    start, end = oura_ring._format_datetimes(None, None)
+    end_at = datetime.fromisoformat(end)
+
+    assert end_at.utcoffset() == timedelta(0)
+    assert abs(end_at - datetime.now(timezone.utc)) < timedelta(seconds=5)
+    assert datetime.fromisoformat(start) == end_at - timedelta(days=1)
+
+
+def test_format_datetimes_reads_naive_ends_as_utc():
+    assert oura_ring._format_datetimes(
+        "2024-01-01T00:00:00", "2024-01-02T00:00:00+02:00"
+    ) == ("2024-01-01 00:00:00+00:00", "2024-01-02 00:00:00+02:00")
+
+    with pytest.raises(ValueError):
+        oura_ring._format_datetimes("2024-01-01T23:00:00", "2024-01-02T00:00:00+02:00")
+
+
+def test_format_datetimes_accepts_dates_and_datetimes():
+    assert oura_ring._format_datetimes(
+        date(2024, 1, 1), datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    ) == ("2024-01-01 00:00:00+00:00", "2024-01-01 12:00:00+00:00")
+
+
+def test_format_dates_accepts_date_objects():
+    assert oura_ring._format_dates(date(2024, 1, 1), datetime(2024, 1, 2, 23, 30)) == (
+        "2024-01-01",
+        "2024-01-02",
+    )
+
+
+@pytest.mark.parametrize("value", ["2024-13-01", "yesterday", "2024-01-01T00:00:00"])
+def test_format_dates_rejects_malformed_dates(value):
+    with pytest.raises(ValueError):
+        oura_ring._format_dates(value, "2024-12-31")
+
+
+def test_format_dates_parses_a_repeated_window_once():
+    oura_ring._parse_dates.cache_clear()
+
+    for _ in range(3):
+        oura_ring._format_dates("2024-01-01", "2024-01-31")
+
+    assert oura_ring._parse_dates.cache_info().misses == 1
+
+
+_HEART_RATE = [
+    {"bpm": 61, "source": "awake", "timestamp": "2024-01-01T02:00:00+02:00"},
+    {"bpm": 58, "source": "rest", "timestamp": "2024-01-01T00:05:00+00:00"},
+]
+
+
+@needs_numpy
+def test_heart_rate_as_arrays(client, monkeypatch):
+    monkeypatch.setattr(
+        OuraClient, "_make_paginated_request", lambda self, **_: _HEART_RATE
+    )
+    arrays = client.get_heart_rate("2024-01-01", "2024-01-02", as_arrays=True)
+
+    assert arrays["bpm"].dtype == oura_ring.np.int16
+    assert arrays["bpm"].tolist() == [61, 58]
+    assert arrays["source"].tolist() == ["awake", "rest"]
+    assert arrays["timestamp"].astype(str).tolist() == [
+        "2024-01-01T00:00:00",
+        "2024-01-01T00:05:00",
+    ]
+
+
+@needs_httpx
+@needs_numpy
+def test_async_heart_rate_as_arrays():
+    def handler(request):
+        return httpx.Response(200, json={"data": _HEART_RATE, "next_token": None})
+
+    async def main():
+        async with _async_client(handler) as client:
+            return await client.get_heart_rate(as_arrays=True)
+
+    assert asyncio.run(main())["bpm"].tolist() == [61, 58]
+
+
+def test_as_arrays_requires_numpy(client, monkeypatch):
+    monkeypatch.setattr(oura_ring, "np", None)
+
+    with pytest.raises(ImportError, match="numpy"):
+        client.get_heart_rate(as_arrays=True)
+
+
+@needs_httpx
+def test_async_as_arrays_requires_numpy(monkeypatch):
+    monkeypatch.setattr(oura_ring, "np", None)
+
+    with pytest.raises(ImportError, match="numpy"):
+        asyncio.run(AsyncOuraClient("token").get_heart_rate(as_arrays=True))
+
+
+_SLEEP = {"id": "a", "movement_30_sec": "1123", "sleep_phase_5_min": "4421"}
+
+
+@needs_numpy
+def test_decode_phases_returns_uint8_arrays(client, monkeypatch):
+    monkeypatch.setattr(
+        OuraClient, "_make_paginated_request", lambda self, **_: [_SLEEP, {"id": "b"}]
+    )
+    records = client.get_sleep_periods("2024-01-01", "2024-01-02", decode_phases=True)
+
+    assert records[0]["movement_30_sec"].dtype == oura_ring.np.uint8
+    assert records[0]["movement_30_sec"].tolist() == [1, 1, 2, 3]
+    assert records[0]["sleep_phase_5_min"].tolist() == [4, 4, 2, 1]
+    assert records[1] == {"id": "b"}
+    assert _SLEEP["movement_30_sec"] == "1123"
+
+
+@needs_httpx
+@needs_numpy
+def test_async_decode_phases_single_document():
+    async def main():
+        async with _async_client(
+            lambda request: httpx.Response(200, json=_SLEEP)
+        ) as client:
+            return await client.get_sleep_periods(document_id="a", decode_phases=True)
+
+    assert asyncio.run(main())["sleep_phase_5_min"].tolist() == [4, 4, 2, 1]
+
+
+def test_decode_phases_requires_numpy(client, monkeypatch):
+    monkeypatch.setattr(oura_ring, "np", None)
+
+    with pytest.raises(ImportError, match="numpy"):
+        client.get_sleep_periods(decode_phases=True)
+
+    if httpx is not None:
+        with pytest.raises(ImportError, match="numpy"):
+            asyncio.run(AsyncOuraClient("token").get_sleep_periods(decode_phases=True))
+
+
+def _run_in_threads(flight, fn, count):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(_outcome(flight, fn)))
+        for _ in range(count)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    return results, threads
+
+
+def _outcome(flight, fn):
+    try:
+        return flight.do("key", fn)
+    except RuntimeError as error:
+        return error
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_single_flight_coalesces_concurrent_calls(fails):
+    flight = oura_ring._SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(True)
+        release.wait(5)
+        if fails:
+            raise RuntimeError("boom")
+        return [{"id": "a"}]
+
+    results, threads = _run_in_threads(flight, fetch, 4)
+
+    # Give every thread time to join the call before the leader finishes.
+    time.sleep(0.1)
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [True]
+    assert not flight._calls
+
+    if fails:
+        assert all(isinstance(result, RuntimeError) for result in results)
+    else:
+        assert all(result == [{"id": "a"}] for result in results)
+        assert len({id(result) for result in results}) == 4
+
+
+@needs_httpx
+def test_async_single_flight_coalesces_concurrent_awaits():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": "me"})
+
+    async def main():
+        async with _async_client(handler) as client:
+            results = await asyncio.gather(
+                *(client.get_personal_info() for _ in range(4))
+            )
+
+            return results, client._inflight._calls
+
+    results, pending = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert results == [{"id": "me"}] * 4
+    assert len({id(result) for result in results}) == 4
+    assert not pending
+
+
+def test_clients_built_on_many_threads_share_one_session():
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(OuraClient("threads")))
+        for _ in range(8)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    key = oura_ring._session_key("threads")
+
+    assert len({id(client.session) for client in clients}) == 1
+    assert len(oura_ring._SESSIONS[key][1]) == 8
+
+    for client in clients:
+        client.close()
+
+    assert key not in oura_ring._SESSIONS
+
+
+def test_unclosed_clients_are_released_when_collected():
+    client = OuraClient("collected")
+    key = oura_ring._session_key("collected")
+    executor = client._executor
+
+    assert not hasattr(OuraClient, "__del__")
+    assert key in oura_ring._SESSIONS
+
+    del client
+
+    assert key not in oura_ring._SESSIONS
+    assert executor._shutdown
+
+
+def test_close_is_idempotent():
+    client = OuraClient("twice")
+    client.close()
+    client.close()
+
+    assert oura_ring._session_key("twice") not in oura_ring._SESSIONS
+
+
+def test_leftover_sessions_are_closed_at_exit(monkeypatch):
+    monkeypatch.setattr(oura_ring, "_SESSIONS", {})
+    client = OuraClient("exit")
+    closed = []
+    monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+
+    oura_ring._close_sessions()
+
+    assert closed == [True]
+    assert not oura_ring._SESSIONS
+
+    client.close()
+
+
+def test_keep_alive_adapter_drops_idle_connections(monkeypatch):
+    monkeypatch.setattr(
+        oura_ring.HTTPAdapter, "send", lambda self, request, *_, **__: _response()
+    )
+    adapter = oura_ring._KeepAliveAdapter()
+    cleared = []
+    monkeypatch.setattr(adapter.poolmanager, "clear", lambda: cleared.append(True))
+
+    adapter.send(requests.Request("GET", "https://example.com").prepare())
+    assert not cleared
+
+    adapter._last_used -= oura_ring.KEEPALIVE_EXPIRY + 1
+    adapter.send(requests.Request("GET", "https://example.com").prepare())
+    assert cleared == [True]
+    assert time.monotonic() - adapter._last_used < 1
+
+
+def test_keep_alive_adapter_is_mounted_and_picklable():
+    session = oura_ring._build_session("token")
+    adapter = session.get_adapter("https://api.ouraring.com")
+
+    assert isinstance(adapter, oura_ring._KeepAliveAdapter)
+    assert pickle.loads(pickle.dumps(adapter))._last_used == adapter._last_used
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_split_window_walks_do_not_prefetch_on_the_pool(client, monkeypatch, fails):
+    submitted = []
+    submit = OuraClient._submit
+
+    def record_submit(self, fn, *args):
+        submitted.append(fn)
+        return submit(self, fn, *args)
+
+    def send_request(self, prepared, settings):
+        if "next_token" not in prepared.url:
+            return {"data": [{"id": prepared.url}], "next_token": "more"}
+        if fails:
+            raise RuntimeError("boom")
+        return {"data": [], "next_token": None}
+
+    monkeypatch.setattr(OuraClient, "_submit", record_submit)
+    monkeypatch.setattr(OuraClient, "_send_request", send_request)
+
+    if fails:
+        with pytest.raises(RuntimeError):
+            client.get_daily_sleep("2024-01-01", "2024-02-29")
+    else:
+        assert len(client.get_daily_sleep("2024-01-01", "2024-02-29")) == 5
+
+    assert submitted == [list] * 5
+
+
+@pytest.fixture
+def forked(monkeypatch):
+    # Act as the child of a fork without forking, so the reset is measured in-process.
+    monkeypatch.setattr(oura_ring, "_SESSIONS", dict(oura_ring._SESSIONS))
+    monkeypatch.setattr(oura_ring, "_SESSIONS_LOCK", oura_ring._SESSIONS_LOCK)
+
+    def fork():
+        pid = os.getpid() + 1
+        oura_ring._forget_sessions()
+        monkeypatch.setattr(oura_ring.os, "getpid", lambda: pid)
+
+    return fork
+
+
+def test_session_is_reset_after_fork(client, forked):
+    session, executor, lock = client.session, client._executor, oura_ring._SESSIONS_LOCK
+    forked()
+
+    assert not oura_ring._SESSIONS
+    assert oura_ring._SESSIONS_LOCK is not lock
+    assert client.session is not session
+    assert client._executor is not executor
+    assert not executor._shutdown
+
+    client.close()
+
+    assert client._executor._shutdown
+    assert not oura_ring._SESSIONS
+
+
+def test_pool_is_rebuilt_after_fork(client, forked):
+    executor = client._executor
+    forked()
+
+    assert client._submit(int).result() == 0
+    assert client._executor is not executor
+
+
+def test_response_cache_disabled_without_size_or_directory():
+    cache = oura_ring._ResponseCache(0)
+    cache.set("key", {"a": 1}, None)
+
+    assert cache.get("key") is None
+
+
+def test_response_cache_with_zero_size_only_persists(tmp_path):
+    cache = oura_ring._ResponseCache(0, str(tmp_path))
+    cache.set("a" * 64, {"a": 1}, None)
+
+    assert not cache._entries
+    assert cache.get("a" * 64) == {"a": 1}
+
+
+def test_response_cache_removes_expired_files_on_lookup(tmp_path):
+    key = "b" * 64
+    (tmp_path / f"{key}.json").write_text('{"expires": 1, "data": {}}')
+    (tmp_path / f"{'c' * 64}.json").write_text("torn")
+    cache = oura_ring._ResponseCache(8, str(tmp_path))
+
+    assert cache.get(key) is None
+    assert cache.get("c" * 64) is None
+    assert not (tmp_path / f"{key}.json").exists()
+
+
+def test_response_cache_clear_without_directory_on_disk(tmp_path):
+    cache = oura_ring._ResponseCache(8, str(tmp_path / "missing"))
+    cache.set("d" * 64, {"a": 1}, None)
+    (tmp_path / "missing" / f"{'d' * 64}.json").unlink()
+    (tmp_path / "missing").rmdir()
+    cache.clear()
+
+    assert cache.get("d" * 64) is None
+
+
+@needs_httpx
+def test_async_client_serves_and_clears_cached_pages():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params.get("next_token"))
+        return _pages(request)
+
+    async def main():
+        async with _async_client(handler) as client:
+            first = await client.get_workouts("2024-01-01", "2024-01-02")
+            second = await client.get_workouts("2024-01-01", "2024-01-02")
+            client.cache_clear()
+            await client.get_workouts("2024-01-01", "2024-01-02")
+
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert first == second
+    assert first is not second
+    assert calls == [None, "1", "2"] * 2
+
+
+def test_validator_cache_is_bounded():
+    validators = oura_ring._ValidatorCache(2)
+
+    for key in "abc":
+        validators.set(key, "If-None-Match", key, b"{}")
+
+    validators.get("b")
+    validators.set("d", "If-None-Match", "d", b"{}")
+
+    assert list(validators._entries) == ["b", "d"]
+
+    disabled = oura_ring._ValidatorCache(0)
+    disabled.set("a", "If-None-Match", "a", b"{}")
+
+    assert disabled.get("a") is None
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"ETag": '"v"', "Last-Modified": "then"}, ("If-None-Match", '"v"')),
+        ({"Last-Modified": "then"}, ("If-Modified-Since", "then")),
+        ({}, None),
+    ],
+)
+def test_revalidation_header_prefers_etag(headers, expected):
+    assert oura_ring._revalidation_header(headers) == expected
+
+
+def test_cache_dir_pruning_leaves_other_files_alone(tmp_path):
+    (tmp_path / "notes.json").write_text("{}")
+    (tmp_path / f"{'e' * 64}.json").symlink_to(tmp_path / "gone.json")
+    cache = oura_ring._ResponseCache(1, str(tmp_path))
+    cache.set("f" * 64, {"a": 1}, None)
+
+    assert (tmp_path / "notes.json").exists()
+    assert (tmp_path / f"{'f' * 64}.json").exists()
+
+
+_COLLECTIONS = [name for name in _ITER_ENDPOINTS if name != "heart_rate"]
+
+
+@pytest.mark.parametrize("name", _COLLECTIONS)
+def test_collections_request_their_own_endpoint(client, monkeypatch, name):
+    paths = []
+
+    def send(prepared, **_):
+        paths.append(prepared.path_url)
+        return _response(body=b'{"data": [], "next_token": null}')
+
+    client.session = requests.Session()
+    monkeypatch.setattr(client.session, "send", send)
+    slug = getattr(oura_ring, f"_SLUG_{name.upper()}")
+
+    getattr(client, f"get_{name}")("2024-01-01", "2024-01-02")
+    getattr(client, f"get_{name}")(document_id="doc")
+
+    assert paths[0].startswith(f"/{slug}?")
+    assert paths[1] == f"/{slug}/doc"
+
+
+@needs_httpx
+@pytest.mark.parametrize("name", _COLLECTIONS)
+def test_async_collections_request_their_own_endpoint(name):
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"data": [], "next_token": None})
+
+    async def main():
+        async with _async_client(handler) as client:
+            await getattr(client, f"get_{name}")("2024-01-01", "2024-01-02")
+            await getattr(client, f"get_{name}")(document_id="doc")
+
+    asyncio.run(main())
+    slug = getattr(oura_ring, f"_SLUG_{name.upper()}")
+
+    assert paths == [f"/{slug}", f"/{slug}/doc"]